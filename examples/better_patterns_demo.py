@@ -7,9 +7,22 @@ by running real examples and measuring actual token counts.
 Run: python examples/better_patterns_demo.py
 """
 
+import functools
 import json
 
-from ptoon import count_tokens, encode
+from ptoon import encode
+
+
+@functools.lru_cache(maxsize=1)
+def _get_encoder():
+    """Load the tokenizer ptoon.count_tokens uses (GPT-4o) once for all demos."""
+    try:
+        import tiktoken
+    except ImportError as exc:
+        raise RuntimeError(
+            "tiktoken is required for token counting. Install with: pip install tiktoken or pip install ptoon[benchmark]"
+        ) from exc
+    return tiktoken.get_encoding("o200k_base")
 
 
 def print_comparison(name, nested_data, flat_data):
@@ -18,9 +31,10 @@ def print_comparison(name, nested_data, flat_data):
     flat_json = json.dumps(flat_data)
     flat_toon = encode(flat_data)
 
-    nested_tokens = count_tokens(nested_json)
-    flat_json_tokens = count_tokens(flat_json)
-    flat_toon_tokens = count_tokens(flat_toon)
+    # Tokenize all three strings in a single batch call
+    nested_tokens, flat_json_tokens, flat_toon_tokens = map(
+        len, _get_encoder().encode_ordinary_batch([nested_json, flat_json, flat_toon])
+    )
 
     json_savings = (nested_tokens - flat_json_tokens) / nested_tokens * 100
     toon_savings = (nested_tokens - flat_toon_tokens) / nested_tokens * 100
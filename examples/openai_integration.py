@@ -6,6 +6,10 @@ CAUTION: Running this example will incur OpenAI API costs.
 Cost Guardrails:
 - Set SMALL_DATA=1 to use a smaller dataset (10 records instead of 100)
 - Set DRY_RUN=true to preview token counts without making API calls
+- Set USE_BATCH=1 to send the RAG requests through the Batch API (50% cheaper,
+  results within 24h)
+- Set PTOON_TOKEN_CACHE=1 to cache token counts in ~/.cache/ptoon/tokens.json
+  so repeated runs skip re-tokenizing the same data
 - Copy examples/.env.example to examples/.env and configure
 
 Key benefits of TOON vs JSON:
@@ -37,19 +41,29 @@ Usage:
 
     # Run with full data (incurs higher API costs)
     SMALL_DATA=0 DRY_RUN=false python examples/openai_integration.py
+
+    # Run all examples without pausing (also the default when stdin is not a TTY)
+    python examples/openai_integration.py --non-interactive
 """
 
 from __future__ import annotations
 
+import argparse
+import asyncio
+import atexit
+import functools
+import hashlib
 import json
 import os
 import sys
+from pathlib import Path
 from typing import Any
 
 
 try:
     import openai
     import tiktoken
+    from openai.types.chat import ChatCompletion
 except ImportError:  # pragma: no cover - example dependency check
     print(
         'Error: Missing dependencies. Install with: pip install -e ".[examples]"',
@@ -57,6 +71,11 @@ except ImportError:  # pragma: no cover - example dependency check
     )
     sys.exit(1)
 
+try:
+    import orjson  # optional: faster JSON formatting for the comparisons
+except ImportError:  # pragma: no cover - falls back to the stdlib encoder
+    orjson = None
+
 import ptoon
 from benchmarks.datasets import generate_tabular_dataset
 
@@ -70,6 +89,11 @@ TOKENIZER_ENCODING: str = "o200k_base"  # GPT-4o tokenizer
 SMALL_DATA: bool = os.getenv("SMALL_DATA", "1") == "1"  # Default: use small dataset
 DRY_RUN: bool = os.getenv("DRY_RUN", "true").lower() == "true"  # Default: dry run mode
 DATASET_LIMIT = 10 if SMALL_DATA else 100
+USE_BATCH: bool = os.getenv("USE_BATCH", "0") == "1"  # Default: real-time Chat Completions
+BATCH_POLL_SECONDS = 30
+MAX_CONCURRENT_REQUESTS = 4  # Real-time requests in flight at once, to stay within rate limits
+TOKEN_CACHE: bool = os.getenv("PTOON_TOKEN_CACHE", "0") == "1"  # Default: always re-tokenize
+TOKEN_CACHE_PATH = Path.home() / ".cache" / "ptoon" / "tokens.json"
 
 if not OPENAI_API_KEY:  # Basic validation before making API calls
     print("Error: OPENAI_API_KEY environment variable is not set.", file=sys.stderr)
@@ -77,15 +101,165 @@ if not OPENAI_API_KEY:  # Basic validation before making API calls
     # Do not exit immediately so that the module can still be imported for reading.
 
 
+@functools.lru_cache(maxsize=4)
+def _get_encoder(name: str) -> tiktoken.Encoding:
+    """Load a tiktoken encoding once and reuse it across calls."""
+    return tiktoken.get_encoding(name)
+
+
+def _token_cache_key(text: str) -> str:
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+    return f"{TOKENIZER_ENCODING}:{digest}"
+
+
+# On-disk token counts, loaded on first use; new counts are written back once at exit
+_TOKEN_CACHE: dict[str, int] | None = None
+_token_cache_dirty = False
+
+
+def _load_token_cache() -> dict[str, int]:
+    """Return the token-count cache, reading it from disk on first use.
+
+    A missing or corrupt file starts empty. The first load also registers the
+    exit hook that saves any counts added during the run.
+    """
+    global _TOKEN_CACHE
+    if _TOKEN_CACHE is None:
+        try:
+            with TOKEN_CACHE_PATH.open(encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            cache = {}
+        _TOKEN_CACHE = cache if isinstance(cache, dict) else {}
+        atexit.register(_save_token_cache)
+    return _TOKEN_CACHE
+
+
+def _save_token_cache() -> None:
+    """Write the token-count cache atomically; failures only cost a re-count next run."""
+    if _TOKEN_CACHE is None or not _token_cache_dirty:
+        return
+    tmp_path = TOKEN_CACHE_PATH.with_name(f"{TOKEN_CACHE_PATH.name}.tmp")
+    try:
+        TOKEN_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump(_TOKEN_CACHE, f)
+        tmp_path.replace(TOKEN_CACHE_PATH)
+    except OSError as exc:
+        print(f"Warning: could not write token cache ({exc})", file=sys.stderr)
+
+
+def _count_tokens_uncached(texts: list[str]) -> list[int]:
+    enc = _get_encoder(TOKENIZER_ENCODING)
+    if len(texts) == 1:
+        return [len(enc.encode_ordinary(texts[0]))]
+    return [len(ids) for ids in enc.encode_ordinary_batch(texts, num_threads=os.cpu_count() or 4)]
+
+
 def count_tokens(text: str) -> int:
     """Count tokens using GPT-4o tokenizer (o200k_base)."""
-    enc = tiktoken.get_encoding(TOKENIZER_ENCODING)
-    return len(enc.encode(text))
+    return count_tokens_batch([text])[0]
+
+
+def count_tokens_batch(texts: list[str]) -> list[int]:
+    """Count tokens for several strings in one parallel tiktoken call.
+
+    With PTOON_TOKEN_CACHE=1, counts are looked up in (and added to) the on-disk
+    cache first, so re-runs over the same data skip tokenization entirely.
+    """
+    global _token_cache_dirty
+    if not TOKEN_CACHE:
+        return _count_tokens_uncached(texts)
+
+    cache = _load_token_cache()
+    keys = [_token_cache_key(text) for text in texts]
+    missing = [i for i, key in enumerate(keys) if key not in cache]
+    if missing:
+        for i, n in zip(missing, _count_tokens_uncached([texts[i] for i in missing]), strict=True):
+            cache[keys[i]] = n
+        _token_cache_dirty = True
+    return [cache[key] for key in keys]
+
+
+async def run_batch(client: openai.AsyncOpenAI, prompts: list[str]) -> list[Any]:
+    """Run chat completions through the OpenAI Batch API and return them in prompt order.
+
+    Batch requests are billed at half the real-time price but may take up to
+    24 hours to complete, so this polls until the batch reaches a final state.
+    """
+    requests = "\n".join(
+        json.dumps(
+            {
+                "custom_id": f"request-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": MODEL,
+                    "messages": [{"role": "user", "content": prompt}],
+                    "temperature": 0,
+                },
+            }
+        )
+        for i, prompt in enumerate(prompts)
+    )
+    input_file = await client.files.create(file=("requests.jsonl", requests.encode("utf-8")), purpose="batch")
+    batch = await client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    print(f"Submitted batch {batch.id} with {len(prompts)} requests; polling every {BATCH_POLL_SECONDS}s...")
+    while batch.status not in ("completed", "failed", "expired", "cancelled"):
+        await asyncio.sleep(BATCH_POLL_SECONDS)
+        batch = await client.batches.retrieve(batch.id)
+    if batch.status != "completed" or not batch.output_file_id:
+        raise RuntimeError(f"Batch {batch.id} finished with status {batch.status!r}")
+
+    output = await client.files.content(batch.output_file_id)
+    bodies: dict[str, Any] = {}
+    for line in output.text.splitlines():
+        record = json.loads(line)
+        response = record.get("response")
+        # Failed requests carry an "error" object or a non-200 response instead of a completion
+        if record.get("error") or response is None or response.get("status_code") != 200:
+            continue
+        bodies[record["custom_id"]] = response["body"]
+
+    # Requests rejected outright are absent from the output and only listed in the error file
+    custom_ids = [f"request-{i}" for i in range(len(prompts))]
+    failed = [custom_id for custom_id in custom_ids if custom_id not in bodies]
+    if failed:
+        raise RuntimeError(
+            f"Batch {batch.id} has {len(failed)} failed request(s): {', '.join(failed)} "
+            f"(error file: {batch.error_file_id})"
+        )
+    return [ChatCompletion.construct(**bodies[custom_id]) for custom_id in custom_ids]
 
 
-def format_data_json(data: dict[str, Any]) -> str:
-    """Format data as JSON (standard approach)."""
-    return json.dumps(data, indent=2)
+@functools.lru_cache(maxsize=1)
+def load_dataset() -> dict[str, Any]:
+    """Generate the employee dataset once and share it between the examples.
+
+    The examples only read the result. SMALL_DATA takes a slice into a new dict,
+    so the generated data is never mutated.
+    """
+    data = generate_tabular_dataset()  # 100 employees
+    if SMALL_DATA:
+        data = {**data, "employees": data["employees"][:DATASET_LIMIT]}
+    return data
+
+
+def format_data_json(data: dict[str, Any], pretty: bool = False) -> str:
+    """Format data as JSON (standard approach).
+
+    Compact output is used for prompts and token counts; pass ``pretty=True``
+    for human-readable display.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0).decode("utf-8")
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
 
 
 def format_data_toon(data: dict[str, Any]) -> str:
@@ -95,11 +269,14 @@ def format_data_toon(data: dict[str, Any]) -> str:
 
 def compare_token_counts(data: dict[str, Any]) -> dict[str, float | int]:
     """Compare tokens and character sizes for JSON vs TOON and print a summary table."""
+    # Only counts and sizes are needed, so each string is dropped as soon as it
+    # has been measured instead of keeping both formats alive at once
     json_str = format_data_json(data)
+    json_tokens, json_chars = count_tokens(json_str), len(json_str)
+    del json_str
     toon_str = format_data_toon(data)
-
-    json_tokens = count_tokens(json_str)
-    toon_tokens = count_tokens(toon_str)
+    toon_tokens, toon_chars = count_tokens(toon_str), len(toon_str)
+    del toon_str
 
     savings = json_tokens - toon_tokens
     savings_percent = (savings / json_tokens * 100) if json_tokens else 0.0
@@ -107,8 +284,8 @@ def compare_token_counts(data: dict[str, Any]) -> dict[str, float | int]:
     print("\nToken Comparison:")
     print("\u2500" * 48)
     print(f"{'Format':<10}{'Tokens':>12}{'Size (chars)':>18}")
-    print(f"{'JSON':<10}{json_tokens:>12,}{len(json_str):>18,}")
-    print(f"{'TOON':<10}{toon_tokens:>12,}{len(toon_str):>18,}")
+    print(f"{'JSON':<10}{json_tokens:>12,}{json_chars:>18,}")
+    print(f"{'TOON':<10}{toon_tokens:>12,}{toon_chars:>18,}")
     print("\u2500" * 48)
     print(f"Savings: {savings:,} tokens ({savings_percent:.1f}%)")
 
@@ -175,12 +352,10 @@ def example_token_comparison() -> None:
     print("\n=== EXAMPLE 2: Token Comparison ===")
 
     try:
-        data = generate_tabular_dataset()  # 100 employees
+        data = load_dataset()
     except RuntimeError as exc:
         print(f"Dataset generation failed: {exc}")
         return
-    if SMALL_DATA:
-        data["employees"] = data["employees"][:DATASET_LIMIT]
     print(f"Generated dataset: {len(data['employees'])} employee records ({'SMALL_DATA=1' if SMALL_DATA else 'full'})")
 
     comparison = compare_token_counts(data)
@@ -209,23 +384,21 @@ def example_token_comparison() -> None:
     print(f"Annual savings:  ${annual:0.2f}")
 
     print("\nJSON format (first 500 chars):")
-    print(format_data_json(data)[:500])
+    print(format_data_json(data, pretty=True)[:500])
     print("\nTOON format (first 500 chars):")
     print(format_data_toon(data)[:500])
     print("\nNotice: TOON uses tabular format for uniform arrays, eliminating repeated keys.")
 
 
-def example_rag_retrieval() -> None:
+async def example_rag_retrieval() -> None:
     """Demonstrates RAG-style question answering with TOON format."""
     print("\n=== EXAMPLE 3: RAG-Style Data Retrieval ===")
 
     try:
-        data = generate_tabular_dataset()
+        data = load_dataset()
     except RuntimeError as exc:
         print(f"Dataset generation failed: {exc}")
         return
-    if SMALL_DATA:
-        data["employees"] = data["employees"][:DATASET_LIMIT]
     print(f"Dataset: {len(data['employees'])} employee records ({'SMALL_DATA=1' if SMALL_DATA else 'full'})")
 
     questions = [
@@ -243,52 +416,63 @@ def example_rag_retrieval() -> None:
         print("\nSkipping OpenAI calls: OPENAI_API_KEY not set.")
         return
 
-    client = openai.OpenAI(api_key=OPENAI_API_KEY)
+    json_str = format_data_json(data)
+    toon_str = format_data_toon(data)
+    json_tokens, toon_tokens = count_tokens_batch([json_str, toon_str])
+
+    # Build the data-bearing prompt prefix once per format; only the question
+    # suffix changes per request, and a stable prefix lets the API reuse its prompt cache.
+    json_prefix = (
+        f"You are given the following employee data in JSON. Answer the question.\n\nDATA:\n{json_str}\n\nQUESTION: "
+    )
+    toon_prefix = (
+        "You are given the following employee data in TOON format. Answer the question.\n\n"
+        f"DATA:\n{toon_str}\n\nQUESTION: "
+    )
+    prompt_suffix = "\n\nProvide a concise answer."
+
+    # join() sizes each prompt once; chained '+' would copy the large data prefix twice
+    prompts = ["".join((prefix, q, prompt_suffix)) for prefix in (json_prefix, toon_prefix) for q in questions]
+
+    async with openai.AsyncOpenAI(api_key=OPENAI_API_KEY) as client:
+        if USE_BATCH:
+            responses = await run_batch(client, prompts)
+        else:
+            # The requests are independent, so issue them concurrently, bounded by the semaphore
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+            async def ask(prompt: str) -> Any:
+                async with semaphore:
+                    return await client.chat.completions.create(
+                        model=MODEL,
+                        messages=[{"role": "user", "content": prompt}],
+                        temperature=0,
+                    )
+
+            responses = await asyncio.gather(*(ask(prompt) for prompt in prompts))
+    json_responses = responses[: len(questions)]
+    toon_responses = responses[len(questions) :]
 
     print("\n--- Testing with JSON format ---")
-    json_str = format_data_json(data)
-    json_tokens = count_tokens(json_str)
     print(f"Input tokens: {json_tokens:,}")
     total_json_tokens = 0
-    for q in questions:
-        prompt = (
-            "You are given the following employee data in JSON. Answer the question.\n\n"
-            f"DATA:\n{json_str}\n\n"
-            f"QUESTION: {q}\n\nProvide a concise answer."
-        )
-        resp = client.chat.completions.create(
-            model=MODEL,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0,
-        )
+    for q, resp in zip(questions, json_responses, strict=True):
         ans = (resp.choices[0].message.content or "").strip()
         print(f"Q: {q}")
         print(f"A: {ans}\n")
-        if getattr(resp, "usage", None):
-            total_json_tokens += int(getattr(resp.usage, "total_tokens", 0) or 0)
+        if resp.usage is not None:  # usage can be missing on some responses
+            total_json_tokens += resp.usage.total_tokens
     print(f"Total tokens (JSON): {total_json_tokens:,}")
 
     print("\n--- Testing with TOON format ---")
-    toon_str = format_data_toon(data)
-    toon_tokens = count_tokens(toon_str)
     print(f"Input tokens: {toon_tokens:,}")
     total_toon_tokens = 0
-    for q in questions:
-        prompt = (
-            "You are given the following employee data in TOON format. Answer the question.\n\n"
-            f"DATA:\n{toon_str}\n\n"
-            f"QUESTION: {q}\n\nProvide a concise answer."
-        )
-        resp = client.chat.completions.create(
-            model=MODEL,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0,
-        )
+    for q, resp in zip(questions, toon_responses, strict=True):
         ans = (resp.choices[0].message.content or "").strip()
         print(f"Q: {q}")
         print(f"A: {ans}\n")
-        if getattr(resp, "usage", None):
-            total_toon_tokens += int(getattr(resp.usage, "total_tokens", 0) or 0)
+        if resp.usage is not None:  # usage can be missing on some responses
+            total_toon_tokens += resp.usage.total_tokens
     print(f"Total tokens (TOON): {total_toon_tokens:,}")
 
     if total_json_tokens:
@@ -347,16 +531,15 @@ def example_error_handling() -> None:
     print("\n--- Scenario 3: Graceful Degradation ---")
 
     def safe_decode(response_text: str) -> dict[str, Any] | str:
-        # Try TOON first
-        try:
-            return ptoon.decode(response_text)  # type: ignore[return-value]
-        except Exception:
-            pass
-        # Try JSON
-        try:
-            return json.loads(response_text)  # type: ignore[return-value]
-        except Exception:
-            pass
+        # Pick the likely format up front so the common case never raises:
+        # JSON objects/arrays start with '{' or '[', everything else is tried as TOON first.
+        # Both parsers stay in the chain (TOON root arrays also start with '[').
+        parsers = (json.loads, ptoon.decode) if response_text.lstrip()[:1] in ("{", "[") else (ptoon.decode, json.loads)
+        for parse in parsers:
+            try:
+                return parse(response_text)  # type: ignore[return-value]
+            except Exception:
+                pass
         # Return raw text as fallback
         return response_text
 
@@ -379,7 +562,32 @@ def example_error_handling() -> None:
                 print("All retries failed, using fallback (raw text)")
 
 
-def main() -> None:
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="TOON + OpenAI integration examples")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--interactive",
+        dest="interactive",
+        action="store_true",
+        help="pause between examples (default when stdin is a terminal)",
+    )
+    mode.add_argument(
+        "--non-interactive",
+        dest="interactive",
+        action="store_false",
+        help="run all examples without pausing, e.g. for CI or timing runs",
+    )
+    parser.set_defaults(interactive=sys.stdin.isatty() and os.getenv("PTOON_NONINTERACTIVE", "0") != "1")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+
+    def pause() -> None:
+        if args.interactive:
+            input("\nPress Enter to continue to next example...")
+
     banner = (
         "\n\n"
         "\u2554\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2557\n"
@@ -393,6 +601,9 @@ def main() -> None:
     print("\nCost Guardrails:")
     print(f"  Dataset Size: {DATASET_LIMIT} records ({'SMALL' if SMALL_DATA else 'FULL'})")
     print(f"  Mode: {'DRY RUN (no API calls)' if DRY_RUN else 'LIVE (API calls enabled)'}")
+    print(f"  RAG requests: {'Batch API (50% cost, up to 24h)' if USE_BATCH else 'real-time'}")
+    if TOKEN_CACHE:
+        print(f"  Token cache: {TOKEN_CACHE_PATH}")
     if DRY_RUN:
         print("  \u26a0\ufe0f  DRY RUN mode: Token counts shown, no API calls made")
     else:
@@ -409,13 +620,13 @@ def main() -> None:
 
     try:
         example_basic_pattern()
-        input("\nPress Enter to continue to next example...")
+        pause()
 
         example_token_comparison()
-        input("\nPress Enter to continue to next example...")
+        pause()
 
-        example_rag_retrieval()
-        input("\nPress Enter to continue to next example...")
+        asyncio.run(example_rag_retrieval())
+        pause()
 
         example_error_handling()
     except KeyboardInterrupt:  # pragma: no cover - interactive example
@@ -35,8 +35,9 @@ See Also:
     - README.md: Installation and usage guide
 """
 
-import types as stdlib_types
-from typing import Any
+import functools
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, cast
 
 from .constants import DEFAULT_DELIMITER, DELIMITERS
 
@@ -44,7 +45,7 @@ from .constants import DEFAULT_DELIMITER, DELIMITERS
 # Version info
 __version__ = "0.0.2"
 from .decoder import Decoder
-from .encoder import Encoder
+from .encoder import _REJECTED_TYPES, Encoder
 from .types import (
     Delimiter,
     EncodeOptions,
@@ -55,8 +56,76 @@ from .types import (
 )
 
 
-_default_encoder: Encoder | None = None
-_default_decoder: Decoder | None = None
+if TYPE_CHECKING:
+    from .utils import compare_formats, count_tokens, estimate_savings
+
+
+_VALID_OPTION_KEYS = frozenset({"indent", "delimiter", "length_marker"})
+_ACCEPTED_DELIMITERS = frozenset({DEFAULT_DELIMITER, "|", "\t"})
+_DEFAULT_OPTIONS = {"indent": 2, "delimiter": DEFAULT_DELIMITER, "length_marker": False}
+
+
+# typed=True keeps look-alike keys such as indent=3.0 or length_marker=1 from
+# sharing a cache entry with the valid int/bool options
+@functools.lru_cache(maxsize=16, typed=True)
+def _encoder_for(indent: int, delimiter: Delimiter, length_marker: bool) -> Encoder:
+    """Return a shared Encoder for the given options (Encoders hold no per-call state)."""
+    return Encoder(indent=indent, delimiter=delimiter, length_marker=length_marker)
+
+
+def _check_encoder_options(indent: Any, delimiter: Any, length_marker: Any) -> None:
+    """Raise ValueError unless the encoder option values are valid."""
+    if not isinstance(delimiter, str) or delimiter not in _ACCEPTED_DELIMITERS:
+        raise ValueError(f"delimiter must be one of ',', '|' or '\\t'; got: {repr(delimiter)}")
+    if isinstance(indent, bool) or not isinstance(indent, int) or indent < 0:
+        raise ValueError(f"indent must be a non-negative int; got: {indent!r}")
+    if not isinstance(length_marker, bool):
+        raise ValueError(f"length_marker must be a bool; got: {length_marker!r}")
+
+
+@functools.lru_cache(maxsize=16, typed=True)
+def _checked_encoder_for(indent: int, delimiter: Delimiter, length_marker: bool) -> Encoder:
+    """Validate keyword options and return the shared Encoder.
+
+    Invalid options raise and are never cached, so each distinct valid
+    combination is checked only once.
+    """
+    _check_encoder_options(indent, delimiter, length_marker)
+    return _encoder_for(indent, delimiter, length_marker)
+
+
+def _encoder_from_options(options: Any) -> Encoder:
+    """Validate an encode options dict and return the matching shared Encoder."""
+    if not isinstance(options, dict):
+        raise TypeError(f"options must be a dict, got {type(options).__name__}")
+
+    for key in options:
+        if key not in _VALID_OPTION_KEYS:
+            invalid = sorted(k for k in options if k not in _VALID_OPTION_KEYS)
+            raise ValueError(
+                f"options contains unsupported keys; allowed: {sorted(_VALID_OPTION_KEYS)}; got: {invalid}"
+            )
+
+    indent = options.get("indent", 2)
+    delimiter = options.get("delimiter", DEFAULT_DELIMITER)
+    length_marker = options.get("length_marker", False)
+    _check_encoder_options(indent, delimiter, length_marker)
+    return _encoder_for(indent, cast(Delimiter, delimiter), length_marker)
+
+
+def _is_default_options(options: Any) -> bool:
+    """Return True if options spells out exactly the default settings.
+
+    The exact type checks keep look-alike values such as ``indent=2.0`` or
+    ``length_marker=0`` on the validating path, which rejects them.
+    """
+    return options == _DEFAULT_OPTIONS and type(options["indent"]) is int and type(options["length_marker"]) is bool
+
+
+# Encoder and Decoder hold no per-call state, so the defaults are built once at
+# import time and shared across calls (and threads) without locking.
+_DEFAULT_ENCODER = _encoder_for(2, DEFAULT_DELIMITER, False)
+_DEFAULT_DECODER = Decoder()
 
 
 def encode(input: Any, options: EncodeOptions | dict | None = None) -> str:
@@ -107,59 +176,83 @@ def encode(input: Any, options: EncodeOptions | dict | None = None) -> str:
         decode: Parse TOON strings back to Python values
         estimate_savings: Compare token efficiency vs JSON
     """
+    # Fast path: default options. Encoder.encode rejects modules, classes and
+    # callables itself, so no extra validation is needed here.
+    if options is None or _is_default_options(options):
+        return _DEFAULT_ENCODER.encode(input)
+
     # Input validation
-    if isinstance(input, stdlib_types.ModuleType):
-        raise TypeError(f"Cannot encode {type(input).__name__}: TOON supports dicts, lists, and primitives.")
-    if isinstance(input, type):
-        raise TypeError(f"Cannot encode {type(input).__name__}: TOON supports dicts, lists, and primitives.")
-    if isinstance(
-        input,
-        (
-            stdlib_types.FunctionType,
-            stdlib_types.MethodType,
-            stdlib_types.BuiltinFunctionType,
-        ),
-    ):
+    if isinstance(input, _REJECTED_TYPES):
         raise TypeError(f"Cannot encode {type(input).__name__}: TOON supports dicts, lists, and primitives.")
 
-    if options is not None and not isinstance(options, dict):
-        raise TypeError(f"options must be a dict, got {type(options).__name__}")
+    return _encoder_from_options(options).encode(input)
 
-    if options:
-        valid_keys = {"indent", "delimiter", "length_marker"}
-        invalid = set(options.keys()) - valid_keys
-        if invalid:
-            raise ValueError(
-                f"options contains unsupported keys; allowed: {sorted(valid_keys)}; got: {sorted(invalid)}"
-            )
-        if "delimiter" in options:
-            delimiter_option = options["delimiter"]
-            accepted = [DEFAULT_DELIMITER, "|", "\t"]
-            if delimiter_option not in accepted:
-                raise ValueError(f"delimiter must be one of ',', '|' or '\\t'; got: {repr(delimiter_option)}")
-
-    opts = options or {}
-
-    # Validate and extract indent
-    indent_val = opts.get("indent", 2)
-    if isinstance(indent_val, bool) or not isinstance(indent_val, int) or indent_val < 0:
-        raise ValueError(f"indent must be a non-negative int; got: {indent_val!r}")
-    indent = indent_val
-
-    delimiter = opts.get("delimiter", DEFAULT_DELIMITER)
-
-    # Validate and extract length_marker
-    length_marker_val = opts.get("length_marker", False)
-    if not isinstance(length_marker_val, bool):
-        raise ValueError(f"length_marker must be a bool; got: {length_marker_val!r}")
-    length_marker = length_marker_val
-    if options is None or (indent == 2 and delimiter == DEFAULT_DELIMITER and not length_marker):
-        global _default_encoder
-        if _default_encoder is None:
-            _default_encoder = Encoder(indent=2, delimiter=DEFAULT_DELIMITER, length_marker=False)
-        return _default_encoder.encode(input)
-    encoder = Encoder(indent=indent, delimiter=delimiter, length_marker=length_marker)
-    return encoder.encode(input)
+
+def encode_many(inputs: Iterable[Any], options: EncodeOptions | dict | None = None) -> list[str]:
+    """Encode several Python values to TOON with the same options.
+
+    Equivalent to ``[encode(item, options) for item in inputs]``, but the options
+    are validated and the encoder is looked up once for the whole batch.
+
+    Args:
+        inputs: Iterable of values to encode; each item accepts anything ``encode()`` does.
+        options: Optional encoding configuration, as for ``encode()``.
+
+    Returns:
+        list[str]: TOON-formatted strings, in input order.
+
+    Raises:
+        TypeError: If any item contains non-serializable types or if options is not a dict.
+        ValueError: If any item cannot be encoded or if options has invalid values.
+
+    Examples:
+        >>> import ptoon
+        >>> ptoon.encode_many([{"id": 1}, [1, 2]])
+        ['id: 1', '[2]: 1,2']
+
+    See Also:
+        encode: Encode a single value
+    """
+    encoder = _DEFAULT_ENCODER if options is None else _encoder_from_options(options)
+    return [encoder.encode(item) for item in inputs]
+
+
+def encode_with_options(
+    input: Any,
+    *,
+    indent: int = 2,
+    delimiter: Delimiter = DEFAULT_DELIMITER,
+    length_marker: bool = False,
+) -> str:
+    """Encode a Python value to TOON with options passed as keyword arguments.
+
+    A lower-overhead alternative to ``encode(input, options)`` for hot loops:
+    there is no options dict to build and check, and each distinct combination
+    of option values is validated only the first time it is used.
+
+    Args:
+        input: Python value to encode, as for ``encode()``.
+        indent: Spaces per indentation level; must be a non-negative int (default: 2).
+        delimiter: Value separator - ',', '|', or '\\t' (default: ',').
+        length_marker: Include #N length markers in headers (default: False).
+
+    Returns:
+        str: TOON-formatted string representation of the input.
+
+    Raises:
+        TypeError: If input contains non-serializable types (functions, classes, modules).
+        ValueError: If input contains circular references or invalid structures,
+            or if any option has an invalid value.
+
+    Examples:
+        >>> import ptoon
+        >>> ptoon.encode_with_options({"tags": ["a", "b"]}, delimiter="|")
+        'tags[2|]: a|b'
+
+    See Also:
+        encode: Encode with a validated options dict
+    """
+    return _checked_encoder_for(indent, delimiter, length_marker).encode(input)
 
 
 def decode(input: str, options: dict | None = None) -> JsonValue:
@@ -220,19 +313,31 @@ def decode(input: str, options: dict | None = None) -> JsonValue:
         )
     if options is not None and not isinstance(options, dict):
         raise TypeError(f"options must be a dict, got {type(options).__name__}")
+    if not input or input.isspace():
+        return {}
+
+    # options reserved for future use to align with encode signature; until
+    # they affect decoding, every call can share one Decoder
+    return _DEFAULT_DECODER.decode(input)
+
+
+# Token utilities are loaded on first access (PEP 562) so that `import ptoon`
+# stays cheap for callers that only encode/decode.
+_LAZY_UTILS = frozenset({"count_tokens", "estimate_savings", "compare_formats"})
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_UTILS:
+        from . import utils
 
-    # options reserved for future use to align with encode signature
-    if options is None:
-        global _default_decoder
-        if _default_decoder is None:
-            _default_decoder = Decoder()
-        return _default_decoder.decode(input)
-    decoder = Decoder()
-    return decoder.decode(input)
+        value = getattr(utils, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-# Import utilities after defining encode/decode to avoid circular imports
-from .utils import compare_formats, count_tokens, estimate_savings  # noqa: E402
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _LAZY_UTILS)
 
 
 __all__ = [
@@ -240,6 +345,8 @@ __all__ = [
     "__version__",
     # API
     "encode",
+    "encode_many",
+    "encode_with_options",
     "decode",
     # Constants
     "DEFAULT_DELIMITER",
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import re
+import sys
 from typing import TYPE_CHECKING, Any
 
-from ptoon.logging_config import get_logger
+from ptoon.logging_config import DEBUG_LOG_LEVEL, get_logger
 
 # Precompiled regex patterns
 from .constants import (
@@ -15,11 +16,9 @@ from .constants import (
     DOUBLE_QUOTE,
     FALSE_LITERAL,
     HEADER_LENGTH_REGEX,
-    INTEGER_REGEX,
     LIST_ITEM_MARKER,
     LIST_ITEM_PREFIX,
     NULL_LITERAL,
-    NUMERIC_REGEX,
     OPEN_BRACE,
     OPEN_BRACKET,
     PIPE,
@@ -34,14 +33,89 @@ if TYPE_CHECKING:
 
 
 _HEADER_LENGTH_PATTERN = re.compile(HEADER_LENGTH_REGEX)
-_INTEGER_PATTERN = re.compile(INTEGER_REGEX)
-_NUMBER_PATTERN = re.compile(NUMERIC_REGEX, re.IGNORECASE)
+
+_LITERAL_MAP: dict[str, Any] = {NULL_LITERAL: None, TRUE_LITERAL: True, FALSE_LITERAL: False}
+
+# Escape sequences for _unquote_string's replace-based path; the escaped backslash is
+# swapped for a sentinel first, and only strings without the sentinel take that path
+_ESCAPED_BACKSLASH = BACKSLASH + BACKSLASH
+_ESCAPED_BACKSLASH_SENTINEL = "\x00"
+_SIMPLE_UNESCAPES = tuple((BACKSLASH + key, char) for key, char in UNESCAPE_SEQUENCES.items() if key != BACKSLASH)
+
+_LIST_ITEM_PREFIX_LEN = len(LIST_ITEM_PREFIX)
+_LIST_MARKERS = (LIST_ITEM_PREFIX, LIST_ITEM_MARKER)
+
+# Characters that change colon-scanning state in _find_colon_index
+_COLON_SCAN_SPECIALS = frozenset((BACKSLASH, DOUBLE_QUOTE, OPEN_BRACKET, OPEN_BRACE))
 
 # Module logger
 logger = get_logger(__name__)
 
 
+_SNIPPET_TRANS = str.maketrans({"\t": "\\t"})
+
+
+def _format_snippet(raw: str) -> str:
+    """Format an input line for error messages: trimmed, tabs made visible, capped at 80 chars."""
+    trimmed = raw.rstrip("\n")
+    snippet = trimmed.strip()
+    if not snippet:
+        snippet = trimmed
+    snippet = snippet.translate(_SNIPPET_TRANS)
+    if len(snippet) > 80:
+        snippet = snippet[:77] + "..."
+    return repr(snippet) if snippet else "''"
+
+
+def _parse_number(t: str) -> Any:
+    """Parse a stripped token that starts with '-' or a digit as a number.
+
+    Classifies the token in one pass against the TOON number grammar
+    (``-?D+(.D+)?([eE][+-]?D+)?``) and returns the int or float it spells,
+    or ``t`` unchanged when it is not a number or is an integer with a
+    forbidden leading zero (e.g. ``007``).
+    """
+    body = t[1:] if t[0] == "-" else t
+    if body.isdecimal():
+        if len(body) > 1 and body[0] == "0":
+            return t
+        try:
+            return int(t)
+        except ValueError:
+            return t
+    exp_pos = body.find("e")
+    if exp_pos == -1:
+        exp_pos = body.find("E")
+    if exp_pos == -1:
+        mantissa, exponent = body, None
+    else:
+        mantissa, exponent = body[:exp_pos], body[exp_pos + 1 :]
+    int_part, dot, frac_part = mantissa.partition(".")
+    if not int_part.isdecimal() or (dot and not frac_part.isdecimal()):
+        return t
+    if exponent is not None:
+        if exponent[:1] in ("+", "-"):
+            exponent = exponent[1:]
+        if not exponent.isdecimal():
+            return t
+    return float(t)
+
+
 class _Ctx:
+    __slots__ = (
+        "kind",
+        "depth",
+        "content_depth",
+        "obj",
+        "arr",
+        "expected",
+        "fields",
+        "delimiter",
+        "from_list_item",
+        "columns",
+        "remaining",
+    )
+
     def __init__(self, kind: str, depth: int):
         self.kind = kind  # 'object' | 'array_list' | 'array_tabular'
         self.depth = depth  # header depth for this context
@@ -52,6 +126,11 @@ class _Ctx:
         self.fields: list[str] | None = None
         self.delimiter: Delimiter = DEFAULT_DELIMITER
         self.from_list_item: bool = False
+        # Columnar tabular arrays: the target column list for each field, or None
+        # where a later duplicate of the field name wins (as it would in a row dict)
+        self.columns: list[list[JsonValue] | None] | None = None
+        # Tabular arrays: rows still to come; the array is complete at 0
+        self.remaining: int = 0
 
 
 class Decoder:
@@ -83,10 +162,20 @@ class Decoder:
 
         >>> decoder.decode('[2]{id, name}:\\n  1, Alice\\n  2, Bob')
         [{'id': 1, 'name': 'Alice'}, {'id': 2, 'name': 'Bob'}]
+
+        >>> Decoder(columnar=True).decode('[2]{id, name}:\\n  1, Alice\\n  2, Bob')
+        {'id': [1, 2], 'name': ['Alice', 'Bob']}
     """
 
-    def __init__(self):
-        pass
+    def __init__(self, columnar: bool = False):
+        """Create a decoder.
+
+        Args:
+            columnar: Decode tabular arrays as a dict of columns
+                (``{field: [values...]}``) instead of a list of row dicts.
+                Avoids building a dict per row for large tables. Default: False.
+        """
+        self.columnar = columnar
 
     def decode(self, toon_string: str) -> JsonValue:
         """Decode TOON string to Python value.
@@ -110,9 +199,14 @@ class Decoder:
         if not text.strip():
             return {}
 
+        debug = logger.isEnabledFor(DEBUG_LOG_LEVEL)
+        # Split once: the indent pre-pass and the main loop both walk these lines
         lines = text.splitlines()
-        logger.debug(f"Decoding TOON string: {len(toon_string)} characters, {len(lines)} lines")
+        if debug:
+            logger.debug(f"Decoding TOON string: {len(toon_string)} characters, {len(lines)} lines")
         indent_size = self._detect_indent_size(lines)
+        # Power-of-two indents (2, 4, 8, ...) are aligned and divided with a mask and shift
+        indent_shift = indent_size.bit_length() - 1 if indent_size & (indent_size - 1) == 0 else None
 
         stack: list[_Ctx] = []
         root: JsonValue | None = None
@@ -124,57 +218,68 @@ class Decoder:
                 self._handle_blank_line(stack, line_num, raw)
                 continue
 
-            depth, content = self._calc_depth_and_content(raw, indent_size, line_num)
-            logger.debug(f"Line {line_num}: depth={depth}, content={content[:50]}")
-
-            # Close tabular arrays that completed before handling new line
-            self._pop_completed_tabular(stack)
-
-            # Unwind contexts on dedent
-            while stack and depth < stack[-1].content_depth:
-                ctx = stack[-1]
-                if (
-                    ctx.kind == "array_list"
-                    and ctx.arr is not None
-                    and ctx.expected is not None
-                    and len(ctx.arr) != ctx.expected
-                ):
-                    raise self._err(
-                        line_num,
-                        (
-                            f"array length mismatch at depth {ctx.depth}; "
-                            f"expected {ctx.expected} items but found {len(ctx.arr)}"
-                        ),
-                        raw,
-                        "Check list indentation and ensure the declared item count matches actual items.",
-                    )
-                logger.debug(f"Popping context: {self._get_context_description(ctx)}")
-                stack.pop()
+            depth, content = self._calc_depth_and_content(raw, indent_size, line_num, indent_shift)
+            if debug:
+                logger.debug(f"Line {line_num}: depth={depth}, content={content[:50]}")
+
+            # Lines that stay inside the object or unfinished tabular array on top of
+            # the stack (the common case) cannot close any context, so skip unwinding
+            top = stack[-1] if stack else None
+            if top is not None and (
+                depth < top.content_depth
+                or top.kind == "array_list"
+                or (top.kind == "array_tabular" and top.remaining <= 0)
+            ):
+                # Close tabular arrays that completed before handling new line
                 self._pop_completed_tabular(stack)
 
-            # Close completed list arrays when next token is not a list item
-            while stack and stack[-1].kind == "array_list":
-                top = stack[-1]
-                if top.arr is not None and top.expected is not None:
-                    if len(top.arr) < top.expected and not (
-                        content.startswith(LIST_ITEM_PREFIX) or content.startswith(LIST_ITEM_MARKER)
+                # Unwind contexts on dedent
+                while stack:
+                    ctx = stack[-1]
+                    if depth >= ctx.content_depth:
+                        break
+                    if (
+                        ctx.kind == "array_list"
+                        and ctx.arr is not None
+                        and ctx.expected is not None
+                        and len(ctx.arr) != ctx.expected
                     ):
-                        # Array not complete yet, but next token is not a list item
                         raise self._err(
                             line_num,
                             (
-                                f"array length mismatch at depth {top.depth}; "
-                                f"expected {top.expected} items but found {len(top.arr)}"
+                                f"array length mismatch at depth {ctx.depth}; "
+                                f"expected {ctx.expected} items but found {len(ctx.arr)}"
                             ),
                             raw,
-                            "Add missing '- ' items or update the declared length marker.",
+                            "Check list indentation and ensure the declared item count matches actual items.",
                         )
-                    if len(top.arr) == top.expected and not (
-                        content.startswith(LIST_ITEM_PREFIX) or content.startswith(LIST_ITEM_MARKER)
-                    ):
-                        stack.pop()
-                        continue
-                break
+                    if debug:
+                        logger.debug(f"Popping context: {self._get_context_description(ctx)}")
+                    stack.pop()
+                    self._pop_completed_tabular(stack)
+
+                # Close completed list arrays when next token is not a list item
+                is_list_item = content.startswith(_LIST_MARKERS)
+                while stack:
+                    top = stack[-1]
+                    if top.kind != "array_list":
+                        break
+                    if top.arr is not None and top.expected is not None:
+                        if len(top.arr) < top.expected and not is_list_item:
+                            # Array not complete yet, but next token is not a list item
+                            raise self._err(
+                                line_num,
+                                (
+                                    f"array length mismatch at depth {top.depth}; "
+                                    f"expected {top.expected} items but found {len(top.arr)}"
+                                ),
+                                raw,
+                                "Add missing '- ' items or update the declared length marker.",
+                            )
+                        if len(top.arr) == top.expected and not is_list_item:
+                            stack.pop()
+                            continue
+                    break
 
             if not stack:
                 # Root line
@@ -182,17 +287,13 @@ class Decoder:
                     # Root array header or inline
                     header, after = self._split_first_colon(content)
                     h = self._parse_header(header, line_num, raw)
-                    logger.debug(
-                        f"Parsing root array: length={h['length']}, fields={h['fields']}, delimiter={repr(h['delimiter'])}"
-                    )
+                    if debug:
+                        logger.debug(
+                            f"Parsing root array: length={h['length']}, fields={h['fields']}, delimiter={repr(h['delimiter'])}"
+                        )
                     if h["fields"] is not None:
                         # tabular root
-                        ctx = _Ctx("array_tabular", depth)
-                        ctx.arr = []
-                        ctx.expected = h["length"]
-                        ctx.fields = h["fields"]
-                        ctx.delimiter = h["delimiter"]
-                        root = ctx.arr
+                        ctx, root = self._new_tabular_ctx(h, depth)
                         stack.append(ctx)
                         continue
                     if after:
@@ -207,38 +308,46 @@ class Decoder:
                         stack.append(ctx)
                     continue
 
-                if self._looks_object_line(content):
+                colon_idx = self._find_colon_index(content)
+                if colon_idx != -1:
                     logger.debug("Parsing root object")
                     root = {}
                     ctx = _Ctx("object", depth)
                     ctx.obj = root
                     ctx.content_depth = depth  # root object keys are at the same depth
                     stack.append(ctx)
-                    self._parse_object_line_into(ctx, content, depth, stack, line_num, raw)
+                    self._parse_object_line_into(ctx, content, depth, stack, line_num, raw, colon_idx)
                     continue
 
                 # Primitive root
-                logger.debug(f"Parsing primitive root: {content[:50]}")
+                if debug:
+                    logger.debug(f"Parsing primitive root: {content[:50]}")
                 root = self._parse_primitive(content, line_num, raw)
                 continue
 
             # Non-root line, route by current context
             top = stack[-1]
             if top.kind == "object" and depth == top.content_depth:
-                logger.debug(f"Parsing object line: {content[:50]}")
+                if debug:
+                    logger.debug(f"Parsing object line: {content[:50]}")
                 self._parse_object_line_into(top, content, depth, stack, line_num, raw)
                 continue
 
             if top.kind == "array_list" and depth == top.content_depth:
-                logger.debug(f"Parsing list item: {content[:50]}")
+                if debug:
+                    logger.debug(f"Parsing list item: {content[:50]}")
                 self._parse_list_item_into(top, content, depth, stack, line_num, raw)
                 # If list reached expected and next constructs are not items, we'll close on dedent later
                 continue
 
             if top.kind == "array_tabular" and depth == top.content_depth:
-                logger.debug(f"Parsing tabular row: {len(self._split_values(content, top.delimiter))} fields")
+                if debug:
+                    logger.debug(f"Parsing tabular row: {len(self._split_values(content, top.delimiter))} fields")
                 self._parse_tabular_row_into(top, content, line_num, raw)
-                self._pop_completed_tabular(stack)
+                # Only this row's array can have just filled up, and tabular arrays
+                # never hold nested contexts, so closing it is a single pop
+                if top.remaining <= 0:
+                    stack.pop()
                 continue
 
             # If line depth equals a parent after popping completed tabular, try again
@@ -259,7 +368,8 @@ class Decoder:
                         raw,
                         "Add missing list items or update the header length marker.",
                     )
-                logger.debug(f"Popping context: {self._get_context_description(ctx)}")
+                if debug:
+                    logger.debug(f"Popping context: {self._get_context_description(ctx)}")
                 stack.pop()
             if stack:
                 top = stack[-1]
@@ -271,7 +381,8 @@ class Decoder:
                     continue
                 if top.kind == "array_tabular" and depth == top.content_depth:
                     self._parse_tabular_row_into(top, content, line_num, raw)
-                    self._pop_completed_tabular(stack)
+                    if top.remaining <= 0:
+                        stack.pop()
                     continue
 
             raise self._err(
@@ -338,17 +449,6 @@ class Decoder:
         hint: str | None = None,
     ) -> ValueError:
         """Build a detailed ValueError with context snippet and hint."""
-
-        def _format_snippet(raw: str) -> str:
-            trimmed = raw.rstrip("\n")
-            snippet = trimmed.strip()
-            if not snippet:
-                snippet = trimmed
-            snippet = snippet.replace("\t", "\\t")
-            if len(snippet) > 80:
-                snippet = snippet[:77] + "..."
-            return repr(snippet) if snippet else "''"
-
         message = f"Line {line_num}: {detail}. Snippet: {_format_snippet(line)}"
         if hint:
             message = f"{message} Hint: {hint}"
@@ -368,47 +468,53 @@ class Decoder:
         Returns:
             int: Detected indent size (default: 2 if no indentation found).
         """
-        indents: list[int] = []
+        detected = 0
         for idx, line in enumerate(lines, start=1):
-            stripped = line.strip()
-            if not stripped:
+            # Unindented lines can neither lower the minimum nor hold a tab in their indentation
+            first = line[:1]
+            if first != " " and first != "\t":
+                continue
+            if not line.strip():
                 continue
             leading = self._count_leading_spaces(line, idx)
-            if leading > 0:
-                indents.append(leading)
-        if not indents:
+            if leading > 0 and (detected == 0 or leading < detected):
+                detected = leading
+        if not detected:
             return 2
-        detected = min(indents)
-        logger.debug(f"Detected indent size: {detected} spaces")
+        if logger.isEnabledFor(DEBUG_LOG_LEVEL):
+            logger.debug(f"Detected indent size: {detected} spaces")
         return detected
 
-    def _calc_depth_and_content(self, line: str, indent_size: int, line_num: int) -> tuple[int, str]:
+    def _calc_depth_and_content(
+        self, line: str, indent_size: int, line_num: int, indent_shift: int | None = None
+    ) -> tuple[int, str]:
         leading = self._count_leading_spaces(line, line_num)
-        if leading % max(indent_size, 1) != 0:
+        if not leading:
+            return 0, line
+        if indent_shift is not None:
+            misaligned = leading & (indent_size - 1)
+            depth = leading >> indent_shift
+        else:
+            depth, misaligned = divmod(leading, max(indent_size, 1))
+        if misaligned:
             raise self._err(
                 line_num,
                 (f"invalid indentation; expected a multiple of {indent_size} spaces but found {leading}"),
                 line,
                 "Adjust indentation to consistent space multiples (2 or 4 spaces).",
             )
-        depth = leading // max(indent_size, 1)
         return depth, line[leading:]
 
     def _count_leading_spaces(self, line: str, line_num: int | None = None) -> int:
-        count = 0
-        for ch in line:
-            if ch == " ":
-                count += 1
-                continue
-            if ch == "\t":
-                raise self._err(
-                    line_num if line_num is not None else 0,
-                    "tab character found in indentation",
-                    line,
-                    "Replace tabs with spaces (2 or 4 spaces recommended).",
-                )
-            break
-        return count
+        stripped = line.lstrip(" ")
+        if stripped.startswith("\t"):
+            raise self._err(
+                line_num if line_num is not None else 0,
+                "tab character found in indentation",
+                line,
+                "Replace tabs with spaces (2 or 4 spaces recommended).",
+            )
+        return len(line) - len(stripped)
 
     def _split_first_colon(self, s: str) -> tuple[str, str]:
         i = self._find_colon_index(s)
@@ -417,6 +523,14 @@ class Decoder:
         return s[:i].rstrip(), s[i + 1 :].lstrip()
 
     def _find_colon_index(self, s: str) -> int:
+        # Fast path: if nothing before the first ':' can open a quote, escape, or
+        # bracket/brace group, that colon is top-level and the scan below is unnecessary
+        first = s.find(COLON)
+        if first == -1:
+            return -1
+        if _COLON_SCAN_SPECIALS.isdisjoint(s[:first]):
+            return first
+
         in_quotes = False
         esc = False
         b = 0
@@ -449,14 +563,14 @@ class Decoder:
                 return i
         return -1
 
-    def _looks_object_line(self, content: str) -> bool:
-        return self._find_colon_index(content) != -1
-
     def _looks_header_token(self, left: str) -> bool:
         """
         Returns True if left contains '[' outside quotes that pairs with ']' before any '{...}' suffix.
         Scans with quote/escape awareness to avoid misfiring on quoted keys containing '['.
         """
+        # Plain keys (no '[' at all) are by far the most common and can never be headers
+        if OPEN_BRACKET not in left:
+            return False
         in_quotes = False
         esc = False
         found_open_bracket = False
@@ -541,19 +655,26 @@ class Decoder:
 
         has_len_marker = False
         delim = DEFAULT_DELIMITER
-        m = _HEADER_LENGTH_PATTERN.fullmatch(inside)
-        if not m:
-            raise self._err(
-                line_num,
-                ("invalid array header length block; expected N or #N with optional delimiter (, |, \\t)"),
-                line,
-                "Declare the array length as [3], [#3], [3|], or [3\\t].",
-            )
-        if inside.startswith("#"):
+        # Plain [N] and [#N] blocks skip the regex; isdecimal() accepts exactly what \d does
+        if inside.isdecimal():
+            length = int(inside)
+        elif inside.startswith("#") and inside[1:].isdecimal():
             has_len_marker = True
-        length = int(m.group(1))
-        if m.group(2):
-            delim = TAB if m.group(2) == "\t" else PIPE
+            length = int(inside[1:])
+        else:
+            m = _HEADER_LENGTH_PATTERN.fullmatch(inside)
+            if not m:
+                raise self._err(
+                    line_num,
+                    ("invalid array header length block; expected N or #N with optional delimiter (, |, \\t)"),
+                    line,
+                    "Declare the array length as [3], [#3], [3|], or [3\\t].",
+                )
+            if inside.startswith("#"):
+                has_len_marker = True
+            length = int(m.group(1))
+            if m.group(2):
+                delim = TAB if m.group(2) == "\t" else PIPE
 
         fields: list[str] | None = None
         after_bracket = after_bracket.strip()
@@ -577,7 +698,8 @@ class Decoder:
             fields = []
             for tok in self._split_values(brace_content, delim):
                 try:
-                    fields.append(self._parse_key_token(tok.strip()))
+                    # Interned so field names repeated across headers share one key object
+                    fields.append(sys.intern(self._parse_key_token(tok.strip())))
                 except ValueError as exc:
                     raise self._err(
                         line_num,
@@ -593,9 +715,10 @@ class Decoder:
             "delimiter": delim,
             "has_length_marker": has_len_marker,
         }
-        logger.debug(
-            f"Parsed header: key={result['key']}, length={result['length']}, fields={result['fields']}, delimiter={repr(result['delimiter'])}"
-        )
+        if logger.isEnabledFor(DEBUG_LOG_LEVEL):
+            logger.debug(
+                f"Parsed header: key={result['key']}, length={result['length']}, fields={result['fields']}, delimiter={repr(result['delimiter'])}"
+            )
         return result
 
     def _parse_inline_array(self, header: dict, values_str: str, line_num: int, line: str) -> JsonArray:
@@ -610,9 +733,7 @@ class Decoder:
                     "Add the missing comma-separated values after the colon.",
                 )
         parts = self._split_values(values_str, header["delimiter"])
-        arr: list[JsonValue] = []
-        for part in parts:
-            arr.append(self._parse_primitive(part, line_num, line))
+        arr: list[JsonValue] = [self._parse_primitive(part, line_num, line) for part in parts]
         if header["length"] != len(arr):
             raise self._err(
                 line_num,
@@ -630,9 +751,15 @@ class Decoder:
         stack: list[_Ctx],
         line_num: int,
         raw_line: str,
+        colon_idx: int | None = None,
     ):
         assert ctx.kind == "object" and ctx.obj is not None
-        left, right = self._split_first_colon(content)
+        # Callers that already located the colon pass it in to avoid rescanning the line
+        idx = self._find_colon_index(content) if colon_idx is None else colon_idx
+        if idx == -1:
+            left, right = content, ""
+        else:
+            left, right = content[:idx].rstrip(), content[idx + 1 :].lstrip()
         if self._looks_header_token(left):
             h = self._parse_header(left, line_num, raw_line)
             if not h["key"]:
@@ -651,13 +778,7 @@ class Decoder:
                         raw_line,
                         "Place tabular rows on indented lines after the header.",
                     )
-                ctx.obj[key] = []
-                arr_ctx = _Ctx("array_tabular", depth)
-                arr_ctx.arr = ctx.obj[key]  # type: ignore
-                arr_ctx.expected = h["length"]
-                arr_ctx.fields = h["fields"]
-                arr_ctx.delimiter = h["delimiter"]
-                arr_ctx.content_depth = depth + 1
+                arr_ctx, ctx.obj[key] = self._new_tabular_ctx(h, depth)
                 stack.append(arr_ctx)
                 return
             # list or inline primitive array
@@ -673,7 +794,6 @@ class Decoder:
             stack.append(arr_ctx)
             return
 
-        idx = self._find_colon_index(content)
         if idx == -1:
             raise self._err(
                 line_num,
@@ -717,7 +837,8 @@ class Decoder:
             ctx.obj[key] = self._parse_inline_array(h, after, line_num, raw_line)
             return
 
-        if self._find_colon_index(value) != -1 and value[0] != DOUBLE_QUOTE:
+        value_colon_idx = self._find_colon_index(value)
+        if value_colon_idx != -1 and value[0] != DOUBLE_QUOTE:
             # nested object inline: key: subkey: value
             nested_ctx = _Ctx("object", depth + 1)
             nested_obj: JsonObject = {}
@@ -726,7 +847,7 @@ class Decoder:
             nested_ctx.from_list_item = False
             ctx.obj[key] = nested_obj
             stack.append(nested_ctx)
-            self._parse_object_line_into(nested_ctx, value, depth + 1, stack, line_num, value)
+            self._parse_object_line_into(nested_ctx, value, depth + 1, stack, line_num, value, value_colon_idx)
             return
         ctx.obj[key] = self._parse_primitive(value, line_num, value)
 
@@ -747,7 +868,7 @@ class Decoder:
                 raw_line,
                 "Prefix array list entries with '- ' followed by the value.",
             )
-        rest = content[len(LIST_ITEM_PREFIX) :].strip()
+        rest = content[_LIST_ITEM_PREFIX_LEN:].strip()
 
         # Empty object item
         if rest == "":
@@ -763,7 +884,8 @@ class Decoder:
             return
 
         # Object item: parse first field on hyphen line
-        if self._find_colon_index(rest) != -1:
+        rest_colon_idx = self._find_colon_index(rest)
+        if rest_colon_idx != -1:
             obj: JsonObject = {}
             ctx.arr.append(obj)
             obj_ctx = _Ctx("object", depth)
@@ -771,12 +893,34 @@ class Decoder:
             obj_ctx.content_depth = depth + 1
             obj_ctx.from_list_item = True
             stack.append(obj_ctx)
-            self._parse_object_line_into(obj_ctx, rest, depth, stack, line_num, rest)
+            self._parse_object_line_into(obj_ctx, rest, depth, stack, line_num, rest, rest_colon_idx)
             return
 
         # Primitive item
         ctx.arr.append(self._parse_primitive(rest, line_num, rest))
 
+    def _new_tabular_ctx(self, header: dict, depth: int) -> tuple[_Ctx, JsonValue]:
+        """Create the context for a tabular array and the value to store for it.
+
+        The value is the row list, or in columnar mode the dict of columns. Either
+        way rows are added to it in place as they are parsed.
+        """
+        ctx = _Ctx("array_tabular", depth)
+        ctx.expected = ctx.remaining = header["length"]
+        ctx.fields = header["fields"]
+        ctx.delimiter = header["delimiter"]
+        if not self.columnar:
+            ctx.arr = []
+            return ctx, ctx.arr
+        # A repeated field name keeps only its last value, as it would in a row dict
+        last_index = {field: i for i, field in enumerate(ctx.fields)}
+        columns: dict[str, Any] = {field: [] for field in last_index}
+        ctx.columns = [columns[field] if last_index[field] == i else None for i, field in enumerate(ctx.fields)]
+        # The last field's column always gets a value per row, so it doubles as the
+        # row count that length checks and error messages read from ctx.arr
+        ctx.arr = ctx.columns[-1] if ctx.columns else []
+        return ctx, columns
+
     def _parse_tabular_row_into(self, ctx: _Ctx, content: str, line_num: int, raw_line: str):
         assert ctx.kind == "array_tabular" and ctx.arr is not None and ctx.fields is not None
         parts = self._split_values(content, ctx.delimiter)
@@ -787,20 +931,18 @@ class Decoder:
                 raw_line,
                 "Check delimiter usage and ensure each row has values for all fields.",
             )
-        row: dict[str, JsonValue] = {}
-        for k, v in zip(ctx.fields, parts, strict=False):
-            row[k] = self._parse_primitive(v, line_num, v)
-        ctx.arr.append(row)
+        if ctx.columns is not None:
+            for column, v in zip(ctx.columns, parts, strict=False):
+                value = self._parse_primitive(v, line_num, v)
+                if column is not None:
+                    column.append(value)
+        else:
+            ctx.arr.append({k: self._parse_primitive(v, line_num, v) for k, v in zip(ctx.fields, parts, strict=False)})
+        ctx.remaining -= 1
 
     def _pop_completed_tabular(self, stack: list[_Ctx]):
-        while stack and stack[-1].kind == "array_tabular":
-            top = stack[-1]
-            if top.arr is None or top.expected is None:
-                break
-            if len(top.arr) >= top.expected:
-                stack.pop()
-            else:
-                break
+        while stack and stack[-1].kind == "array_tabular" and stack[-1].remaining <= 0:
+            stack.pop()
 
     # Primitive parsing
     def _parse_primitive(self, s: str, line_num: int, raw_line: str) -> Any:
@@ -816,31 +958,16 @@ class Decoder:
         """
         t = s.strip()
         result: Any
+        # Dispatch on the first character: only '"' can start a quoted string and only
+        # '-' or a digit can start a number, so most values need at most one check
+        first = t[:1]
         try:
-            if t == NULL_LITERAL:
-                result = None
-            elif t == TRUE_LITERAL:
-                result = True
-            elif t == FALSE_LITERAL:
-                result = False
-            elif self._is_quoted(t):
-                result = self._unquote_string(t)
-            elif self._is_number_like(t):
-                if self._has_forbidden_leading_zeros(t):
-                    result = t
-                # try int first, then float
-                elif _INTEGER_PATTERN.fullmatch(t):
-                    try:
-                        result = int(t)
-                    except ValueError:
-                        result = t
-                else:
-                    try:
-                        result = float(t)
-                    except ValueError:
-                        result = t
+            if first == DOUBLE_QUOTE:
+                result = self._unquote_string(t) if self._is_quoted(t) else t
+            elif not (first == "-" or first.isdecimal()):
+                result = _LITERAL_MAP.get(t, t)
             else:
-                result = t
+                result = _parse_number(t)
         except ValueError as exc:
             detail = str(exc) or "invalid primitive literal"
             raise self._err(
@@ -849,7 +976,8 @@ class Decoder:
                 raw_line,
                 "Check escapes and quote strings that contain special characters.",
             ) from exc
-        logger.debug(f"Parsing primitive: {s[:50]} -> {result}")
+        if logger.isEnabledFor(DEBUG_LOG_LEVEL):
+            logger.debug(f"Parsing primitive: {s[:50]} -> {result}")
         return result
 
     def _is_quoted(self, s: str) -> bool:
@@ -858,42 +986,40 @@ class Decoder:
     def _unquote_string(self, s: str) -> str:
         assert self._is_quoted(s)
         inner = s[1:-1]
+        j = inner.find(BACKSLASH)
+        if j == -1:
+            return inner
+        if _ESCAPED_BACKSLASH_SENTINEL not in inner:
+            # Decode with C-level replaces: park escaped backslashes on a sentinel so the
+            # remaining backslashes each start one escape, then replace the other escapes.
+            # A backslash left over means an invalid or unclosed escape; the loop below
+            # reports it.
+            decoded = inner.replace(_ESCAPED_BACKSLASH, _ESCAPED_BACKSLASH_SENTINEL)
+            for escape, char in _SIMPLE_UNESCAPES:
+                decoded = decoded.replace(escape, char)
+            if BACKSLASH not in decoded:
+                return decoded.replace(_ESCAPED_BACKSLASH_SENTINEL, BACKSLASH)
+        # Copy the runs between backslashes as slices, decoding one escape at a time
         out = []
-        esc = False
-        for ch in inner:
-            if esc:
-                mapped = UNESCAPE_SEQUENCES.get(ch)
-                if mapped is None:
-                    raise ValueError(
-                        f'Invalid escape sequence: \\{ch}. Valid escapes are: \\n, \\r, \\t, \\", \\\\. In string: {s[:50]}'
-                    )
-                out.append(mapped)
-                esc = False
-                continue
-            if ch == BACKSLASH:
-                esc = True
-                continue
-            out.append(ch)
-        if esc:
-            raise ValueError(
-                f'Unclosed escape sequence at end of string: {s[:50]}. Backslash must be followed by n, r, t, ", or \\'
-            )
+        i = 0
+        while j != -1:
+            out.append(inner[i:j])
+            if j + 1 == len(inner):
+                raise ValueError(
+                    f'Unclosed escape sequence at end of string: {s[:50]}. Backslash must be followed by n, r, t, ", or \\'
+                )
+            ch = inner[j + 1]
+            mapped = UNESCAPE_SEQUENCES.get(ch)
+            if mapped is None:
+                raise ValueError(
+                    f'Invalid escape sequence: \\{ch}. Valid escapes are: \\n, \\r, \\t, \\", \\\\. In string: {s[:50]}'
+                )
+            out.append(mapped)
+            i = j + 2
+            j = inner.find(BACKSLASH, i)
+        out.append(inner[i:])
         return "".join(out)
 
-    def _is_number_like(self, s: str) -> bool:
-        return bool(_NUMBER_PATTERN.fullmatch(s))
-
-    def _has_forbidden_leading_zeros(self, s: str) -> bool:
-        if not s:
-            return False
-        negative = s[0] == "-"
-        body = s[1:] if negative else s
-        if not body or not body[0].isdigit():
-            return False
-        if "." in body or "e" in body or "E" in body:
-            return False
-        return len(body) > 1 and body[0] == "0"
-
     def _parse_key_token(self, token: str) -> str:
         t = token.strip()
         if self._is_quoted(t):
@@ -905,54 +1031,56 @@ class Decoder:
 
         Args:
             s: String to split.
-            delimiter: Delimiter character(s).
+            delimiter: Delimiter character.
 
         Returns:
             list[str]: Split and trimmed values.
         """
         if s == "":
             return []
-        # Fast path when there are no quotes or escapes
-        if '"' not in s and "\\" not in s:
-            return [part.strip() for part in s.split(delimiter)]
-        parts: list[str] = []
+        if "\\" not in s:
+            # Fast path when there are no quotes or escapes
+            if '"' not in s:
+                return [part.strip() for part in s.split(delimiter)]
+            # Without escapes, a delimiter is inside quotes exactly when an odd number
+            # of quotes precedes it, so split in C and re-join the quoted pieces
+            pieces = s.split(delimiter)
+            parts: list[str] = []
+            current = pieces[0]
+            odd_quotes = current.count(DOUBLE_QUOTE) & 1
+            for piece in pieces[1:]:
+                if odd_quotes:
+                    current = f"{current}{delimiter}{piece}"
+                else:
+                    parts.append(current.strip())
+                    current = piece
+                odd_quotes ^= piece.count(DOUBLE_QUOTE) & 1
+            parts.append(current.strip())
+            return parts
+        # Slow path: walk the characters, tracking quotes and escapes. Every
+        # Delimiter is a single character, so it compares directly against ch.
+        parts = []
         buf: list[str] = []
         in_quotes = False
         esc = False
-        i = 0
-        delim_len = len(delimiter)
-        while i < len(s):
-            ch = s[i]
+        for ch in s:
             if esc:
                 buf.append(ch)
                 esc = False
-                i += 1
-                continue
-            if ch == BACKSLASH:
+            elif ch == BACKSLASH:
                 buf.append(ch)
                 esc = True
-                i += 1
-                continue
-            if ch == DOUBLE_QUOTE:
+            elif ch == DOUBLE_QUOTE:
                 buf.append(ch)
                 in_quotes = not in_quotes
-                i += 1
-                continue
-            if not in_quotes and self._at_delimiter(s, i, delimiter):
+            elif ch == delimiter and not in_quotes:
                 parts.append("".join(buf).strip())
                 buf = []
-                i += delim_len
-                continue
-            buf.append(ch)
-            i += 1
+            else:
+                buf.append(ch)
         parts.append("".join(buf).strip())
         return parts
 
-    def _at_delimiter(self, s: str, i: int, delimiter: Delimiter) -> bool:
-        if len(delimiter) == 1:
-            return i < len(s) and s[i] == delimiter
-        return s[i : i + len(delimiter)] == delimiter
-
     def _handle_blank_line(self, stack: list[_Ctx], line_num: int, line: str):
         for ctx in reversed(stack):
             if ctx.kind in ("array_list", "array_tabular"):
@@ -1,7 +1,8 @@
+import enum
 import types
 from typing import Any, cast
 
-from ptoon.logging_config import get_logger
+from ptoon.logging_config import DEBUG_LOG_LEVEL, get_logger
 
 from .constants import DEFAULT_DELIMITER, LIST_ITEM_PREFIX
 from .normalize import (
@@ -13,7 +14,13 @@ from .normalize import (
     is_json_primitive,
     normalize_value,
 )
-from .primitives import encode_key, encode_primitive, format_header, join_encoded_values
+from .primitives import (
+    encode_key,
+    encode_primitive,
+    format_header,
+    join_encoded_values,
+    select_primitive_encoder,
+)
 from .types import Delimiter, Depth, JsonArray, JsonObject, JsonPrimitive, JsonValue
 from .writer import LineWriter
 
@@ -21,6 +28,29 @@ from .writer import LineWriter
 # Module logger
 logger = get_logger(__name__)
 
+# Values that are never JSON-compatible; checked with a single isinstance call
+_REJECTED_TYPES = (
+    types.ModuleType,
+    type,
+    types.FunctionType,
+    types.MethodType,
+    types.BuiltinFunctionType,
+)
+
+# Same check as is_json_primitive, as one isinstance call for per-cell loops
+_PRIMITIVE_TYPES = (str, int, float, bool, type(None))
+
+
+class _ArrayShape(enum.IntEnum):
+    """Layout of an array's items, which decides how the array is written."""
+
+    EMPTY = 0
+    PRIMITIVES = 1  # inline: [N]: a,b,c
+    ARRAYS = 2  # only arrays of primitives: one inline array per list item
+    OBJECTS_TABULAR = 3  # uniform objects: [N]{fields}: rows
+    OBJECTS_MIXED = 4  # objects that do not fit the tabular format: list items
+    MIXED = 5  # anything else: list items
+
 
 class Encoder:
     """TOON format encoder.
@@ -72,11 +102,7 @@ class Encoder:
             ValueError: If value contains circular references.
         """
         # Input validation
-        if isinstance(value, types.ModuleType):
-            raise TypeError(f"Cannot encode {type(value).__name__}: TOON supports dicts, lists, and primitives.")
-        if isinstance(value, type):
-            raise TypeError(f"Cannot encode {type(value).__name__}: TOON supports dicts, lists, and primitives.")
-        if isinstance(value, (types.FunctionType, types.MethodType, types.BuiltinFunctionType)):
+        if isinstance(value, _REJECTED_TYPES):
             raise TypeError(f"Cannot encode {type(value).__name__}: TOON supports dicts, lists, and primitives.")
 
         try:
@@ -90,25 +116,31 @@ class Encoder:
                 f"Failed to normalize input of type {type(value).__name__}: {str(e)}. Ensure all values are JSON-compatible."
             ) from e
 
-        logger.debug(
-            f"Normalized input: type={type(normalized_value).__name__}, size={self._estimate_size(normalized_value)}"
-        )
+        if logger.isEnabledFor(DEBUG_LOG_LEVEL):
+            logger.debug(
+                f"Normalized input: type={type(normalized_value).__name__}, size={self._estimate_size(normalized_value)}"
+            )
         result = self._encode_value(normalized_value)
-        logger.debug(f"Encoded to {len(result)} characters")
+        if logger.isEnabledFor(DEBUG_LOG_LEVEL):
+            logger.debug(f"Encoded to {len(result)} characters")
         return result
 
     def _encode_value(self, value: JsonValue) -> str:
         if is_json_primitive(value):
-            logger.debug(f"Encoding primitive: {value}")
+            if logger.isEnabledFor(DEBUG_LOG_LEVEL):
+                logger.debug(f"Encoding primitive: {value}")
             return encode_primitive(value, self.delimiter)
 
         writer = LineWriter(self.indent)
 
         if is_json_array(value):
-            logger.debug(f"Encoding root array: length={len(value)}, type={self._detect_array_type(value)}")
+            # _detect_array_type re-runs tabular detection, so only pay for it when logging
+            if logger.isEnabledFor(DEBUG_LOG_LEVEL):
+                logger.debug(f"Encoding root array: length={len(value)}, type={self._detect_array_type(value)}")
             self._encode_array(None, value, writer, 0)
         elif is_json_object(value):
-            logger.debug(f"Encoding root object: {len(value)} keys")
+            if logger.isEnabledFor(DEBUG_LOG_LEVEL):
+                logger.debug(f"Encoding root object: {len(value)} keys")
             self._encode_object(value, writer, 0)
 
         return writer.to_string()
@@ -127,50 +159,71 @@ class Encoder:
     def _encode_key_value_pair(self, key: str, value: JsonValue, writer: LineWriter, depth: Depth):
         encoded_key = encode_key(key)
 
-        if is_json_primitive(value):
-            writer.push(depth, f"{encoded_key}: {encode_primitive(value, self.delimiter)}")
-        elif is_json_array(value):
-            self._encode_array(key, value, writer, depth)
-        elif is_json_object(value):
-            if not value:
-                writer.push(depth, f"{encoded_key}:")
-            else:
-                writer.push(depth, f"{encoded_key}:")
-                self._encode_object(value, writer, depth + 1)
-
-    def _encode_array(self, key: str | None, value: JsonArray, writer: LineWriter, depth: Depth):
-        if not value:
-            header = format_header(0, key=key, delimiter=self.delimiter, length_marker=self.length_marker)
-            writer.push(depth, header)
-            return
+        # normalize_value rebuilds every container as an exact dict or list, so test
+        # type(value) once and treat everything else as a primitive
+        value_type = type(value)
+        if value_type is list:
+            self._encode_array(key, cast(JsonArray, value), writer, depth)
+        elif value_type is dict:
+            writer.push(depth, f"{encoded_key}:")
+            if value:
+                self._encode_object(cast(JsonObject, value), writer, depth + 1)
+        else:
+            writer.push(depth, f"{encoded_key}: {encode_primitive(cast(JsonPrimitive, value), self.delimiter)}")
 
-        if is_array_of_primitives(value):
-            logger.debug(f"Encoding inline primitive array: {len(value)} items")
-            self._encode_inline_primitive_array(key, value, writer, depth)
-            return
+    def _classify_array(self, value: JsonArray) -> tuple[_ArrayShape, list[str] | None]:
+        """Classify an array's items in one pass over their types.
 
-        if is_array_of_arrays(value):
-            # Check if all nested arrays are primitive arrays
-            all_primitive_arrays = all(is_json_array(arr) and is_array_of_primitives(arr) for arr in value)
-            if all_primitive_arrays:
-                # Special case for array of primitive arrays: encode each array as a list item
-                self._encode_array_of_arrays_as_list_items(key, value, writer, depth)
-                return
+        Args:
+            value: Array to classify.
 
-        if is_array_of_objects(value):
+        Returns:
+            tuple[_ArrayShape, list[str] | None]: The array's shape, plus the
+            tabular field names when the shape is OBJECTS_TABULAR.
+        """
+        if not value:
+            return _ArrayShape.EMPTY, None
+        item_types = {type(item) for item in value}
+        if list not in item_types and dict not in item_types:
+            return _ArrayShape.PRIMITIVES, None
+        if len(item_types) == 1:
+            if list in item_types:
+                if all(is_array_of_primitives(cast(JsonArray, arr)) for arr in value):
+                    return _ArrayShape.ARRAYS, None
+                return _ArrayShape.MIXED, None
             header_fields = self._detect_tabular_header(value)
             if header_fields:
+                return _ArrayShape.OBJECTS_TABULAR, header_fields
+            return _ArrayShape.OBJECTS_MIXED, None
+        return _ArrayShape.MIXED, None
+
+    def _encode_array(self, key: str | None, value: JsonArray, writer: LineWriter, depth: Depth):
+        shape, header_fields = self._classify_array(value)
+
+        if shape is _ArrayShape.EMPTY:
+            header = format_header(0, key=key, delimiter=self.delimiter, length_marker=self.length_marker)
+            writer.push(depth, header)
+        elif shape is _ArrayShape.PRIMITIVES:
+            if logger.isEnabledFor(DEBUG_LOG_LEVEL):
+                logger.debug(f"Encoding inline primitive array: {len(value)} items")
+            self._encode_inline_primitive_array(key, value, writer, depth)
+        elif shape is _ArrayShape.ARRAYS:
+            # Special case for array of primitive arrays: encode each array as a list item
+            self._encode_array_of_arrays_as_list_items(key, value, writer, depth)
+        elif shape is _ArrayShape.OBJECTS_TABULAR:
+            assert header_fields is not None
+            if logger.isEnabledFor(DEBUG_LOG_LEVEL):
                 logger.debug(
                     f"Detected tabular array: {len(value)} rows, {len(header_fields)} columns: {header_fields}"
                 )
-                self._encode_array_of_objects_as_tabular(key, value, header_fields, writer, depth)
-            else:
-                logger.debug("Array not tabular (mixed types or <2 rows), using list format")
-                self._encode_mixed_array_as_list_items(key, value, writer, depth)
-            return
-
-        logger.debug(f"Encoding mixed array as list items: {len(value)} items")
-        self._encode_mixed_array_as_list_items(key, value, writer, depth)
+            self._encode_array_of_objects_as_tabular(key, value, header_fields, writer, depth)
+        elif shape is _ArrayShape.OBJECTS_MIXED:
+            logger.debug("Array not tabular (mixed types or <2 rows), using list format")
+            self._encode_mixed_array_as_list_items(key, value, writer, depth)
+        else:
+            if logger.isEnabledFor(DEBUG_LOG_LEVEL):
+                logger.debug(f"Encoding mixed array as list items: {len(value)} items")
+            self._encode_mixed_array_as_list_items(key, value, writer, depth)
 
     def _encode_inline_primitive_array(self, prefix: str | None, values: JsonArray, writer: LineWriter, depth: Depth):
         formatted = self._format_inline_array(values, prefix)
@@ -221,7 +274,8 @@ class Encoder:
             return None
         # Use tabular format only when there are at least 2 rows
         if len(rows) < 2:
-            logger.debug(f"Checking if array is tabular: {len(rows)} rows (need at least 2)")
+            if logger.isEnabledFor(DEBUG_LOG_LEVEL):
+                logger.debug(f"Checking if array is tabular: {len(rows)} rows (need at least 2)")
             return None
         first_row = rows[0]
         if not isinstance(first_row, dict) or not first_row:
@@ -238,13 +292,16 @@ class Encoder:
         return None
 
     def _is_tabular_array(self, rows: JsonArray, header: list[str], header_len: int) -> bool:
+        # Comparing key views checks the key set in C; values() then avoids a lookup per key
+        header_keys = set(header)
         for row in rows:
             if not isinstance(row, dict):
                 return False
-            if len(row) != header_len:
-                return False
-            if not all(key in row and is_json_primitive(row[key]) for key in header):
+            if len(row) != header_len or row.keys() != header_keys:
                 return False
+            for v in row.values():
+                if not isinstance(v, _PRIMITIVE_TYPES):
+                    return False
         return True
 
     def _encode_array_of_objects_as_tabular(
@@ -266,12 +323,19 @@ class Encoder:
         self._write_tabular_rows(rows, header, writer, depth + 1)
 
     def _write_tabular_rows(self, rows: JsonArray, header: list[str], writer: LineWriter, depth: Depth):
-        for row in rows:
-            # Type guard: rows validated as array of objects with primitive values
-            assert is_json_object(row), "Row must be an object in tabular format"
-            values = [cast(JsonPrimitive, row[key]) for key in header]
-            joined_value = join_encoded_values(values, self.delimiter)
-            writer.push(depth, joined_value)
+        delimiter = self.delimiter
+        objects = cast(list[JsonObject], rows)
+        # Choose each column's encoder once instead of dispatching on type per cell
+        column_encoders = [
+            (key, select_primitive_encoder((cast(JsonPrimitive, row[key]) for row in objects), delimiter))
+            for key in header
+        ]
+        # Rows were validated by _detect_tabular_header as objects with primitive values
+        lines = [
+            delimiter.join([encode(cast(JsonPrimitive, row[key])) for key, encode in column_encoders])
+            for row in objects
+        ]
+        writer.push_many(depth, lines)
 
     def _encode_mixed_array_as_list_items(self, prefix: str | None, items: JsonArray, writer: LineWriter, depth: Depth):
         header = format_header(
@@ -283,12 +347,11 @@ class Encoder:
         writer.push(depth, header)
 
         for item in items:
-            if is_json_primitive(item):
-                writer.push(
-                    depth + 1,
-                    f"{LIST_ITEM_PREFIX}{encode_primitive(item, self.delimiter)}",
-                )
-            elif is_json_array(item):
+            item_type = type(item)
+            if item_type is dict:
+                self._encode_object_as_list_item(cast(JsonObject, item), writer, depth + 1)
+            elif item_type is list:
+                item = cast(JsonArray, item)
                 if is_array_of_primitives(item):
                     inline = self._format_inline_array(item, None)
                     writer.push(depth + 1, f"{LIST_ITEM_PREFIX}{inline}")
@@ -301,9 +364,12 @@ class Encoder:
                             f"TOON format supports up to 2 levels of array nesting. "
                             f"Consider flattening this data structure."
                         )
-            elif is_json_object(item):
-                self._encode_object_as_list_item(item, writer, depth + 1)
-            # Other complex nested arrays are intentionally not handled here per TS behavior.
+                # Other complex nested arrays are intentionally not handled here per TS behavior.
+            else:
+                writer.push(
+                    depth + 1,
+                    f"{LIST_ITEM_PREFIX}{encode_primitive(cast(JsonPrimitive, item), self.delimiter)}",
+                )
 
     def _encode_object_as_list_item(self, obj: JsonObject, writer: LineWriter, depth: Depth):
         """Encode object as list item with first field on hyphen line.
@@ -327,17 +393,14 @@ class Encoder:
         # First key-value on the same line as "- "
         encoded_key = encode_key(first_key)
 
-        if is_json_primitive(first_value):
-            writer.push(
-                depth,
-                f"{LIST_ITEM_PREFIX}{encoded_key}: {encode_primitive(first_value, self.delimiter)}",
-            )
-        elif is_json_array(first_value):
-            if is_array_of_primitives(first_value):
+        first_type = type(first_value)
+        if first_type is list:
+            first_value = cast(JsonArray, first_value)
+            shape, header_fields = self._classify_array(first_value)
+            if shape is _ArrayShape.EMPTY or shape is _ArrayShape.PRIMITIVES:
                 formatted = self._format_inline_array(first_value, first_key)
                 writer.push(depth, f"{LIST_ITEM_PREFIX}{formatted}")
-            elif is_array_of_objects(first_value):
-                header_fields = self._detect_tabular_header(first_value)
+            elif shape is _ArrayShape.OBJECTS_TABULAR or shape is _ArrayShape.OBJECTS_MIXED:
                 if header_fields:
                     header_str = format_header(
                         len(first_value),
@@ -359,17 +422,7 @@ class Encoder:
                     )
                     writer.push(depth, f"{LIST_ITEM_PREFIX}{header}")
                     for it in first_value:
-                        if is_json_object(it):
-                            self._encode_object_as_list_item(it, writer, depth + 2)
-                        elif is_json_array(it):
-                            if is_array_of_primitives(it):
-                                inline = self._format_inline_array(it, None)
-                                writer.push(depth + 2, f"{LIST_ITEM_PREFIX}{inline}")
-                        elif is_json_primitive(it):
-                            writer.push(
-                                depth + 2,
-                                f"{LIST_ITEM_PREFIX}{encode_primitive(it, self.delimiter)}",
-                            )
+                        self._encode_nested_list_item(it, writer, depth + 2)
             else:  # other complex arrays
                 # Write header with key and length on the hyphen line, then encode supported item types
                 header = format_header(
@@ -380,30 +433,37 @@ class Encoder:
                 )
                 writer.push(depth, f"{LIST_ITEM_PREFIX}{header}")
                 for it in first_value:
-                    if is_json_primitive(it):
-                        writer.push(
-                            depth + 2,
-                            f"{LIST_ITEM_PREFIX}{encode_primitive(it, self.delimiter)}",
-                        )
-                    elif is_json_array(it):
-                        if is_array_of_primitives(it):
-                            inline = self._format_inline_array(it, None)
-                            writer.push(depth + 2, f"{LIST_ITEM_PREFIX}{inline}")
-                    elif is_json_object(it):
-                        self._encode_object_as_list_item(it, writer, depth + 2)
-
-        elif is_json_object(first_value):
-            if not first_value:
-                writer.push(depth, f"{LIST_ITEM_PREFIX}{encoded_key}:")
-            else:
-                writer.push(depth, f"{LIST_ITEM_PREFIX}{encoded_key}:")
+                    self._encode_nested_list_item(it, writer, depth + 2)
+
+        elif first_type is dict:
+            writer.push(depth, f"{LIST_ITEM_PREFIX}{encoded_key}:")
+            if first_value:
                 # Nested object content under list item's first field indents by two levels
-                self._encode_object(first_value, writer, depth + 2)
+                self._encode_object(cast(JsonObject, first_value), writer, depth + 2)
+        else:
+            encoded_value = encode_primitive(cast(JsonPrimitive, first_value), self.delimiter)
+            writer.push(depth, f"{LIST_ITEM_PREFIX}{encoded_key}: {encoded_value}")
 
         # Remaining keys on indented lines
         for key in keys[1:]:
             self._encode_key_value_pair(key, obj[key], writer, depth + 1)
 
+    def _encode_nested_list_item(self, item: JsonValue, writer: LineWriter, depth: Depth):
+        """Encode one item of an array that is the first field of a list-item object.
+
+        Objects become list items, primitive arrays are written inline and other
+        nested arrays are skipped.
+        """
+        item_type = type(item)
+        if item_type is dict:
+            self._encode_object_as_list_item(cast(JsonObject, item), writer, depth)
+        elif item_type is list:
+            if is_array_of_primitives(cast(JsonArray, item)):
+                inline = self._format_inline_array(cast(JsonArray, item), None)
+                writer.push(depth, f"{LIST_ITEM_PREFIX}{inline}")
+        else:
+            writer.push(depth, f"{LIST_ITEM_PREFIX}{encode_primitive(cast(JsonPrimitive, item), self.delimiter)}")
+
     def _estimate_size(self, value: JsonValue) -> str:
         """Return human-readable size estimate for logging.
 
@@ -458,12 +518,16 @@ class Encoder:
         """
         if not is_json_array(arr):
             return 0
-        if not arr:
-            return 1
 
+        # Iterative walk: no Python frame per nested array
         max_depth = 1
-        for item in arr:
-            if is_json_array(item):
-                max_depth = max(max_depth, 1 + self._calculate_nesting_depth(item))
+        pending: list[tuple[JsonArray, int]] = [(arr, 1)]
+        while pending:
+            current, depth = pending.pop()
+            if depth > max_depth:
+                max_depth = depth
+            for item in current:
+                if is_json_array(item):
+                    pending.append((item, depth + 1))
 
         return max_depth
@@ -7,7 +7,7 @@ modules with support for the PTOON_DEBUG environment variable.
 
 import logging
 import os
-from functools import lru_cache
+from functools import cache, lru_cache
 
 
 # Constants
@@ -32,6 +32,7 @@ def is_debug_enabled() -> bool:
     return value in ("1", "true", "yes")
 
 
+@cache
 def get_logger(name: str) -> logging.Logger:
     """Create or retrieve logger for given module name.
 
@@ -47,6 +48,10 @@ def get_logger(name: str) -> logging.Logger:
     Examples:
         >>> logger = get_logger(__name__)
         >>> logger.debug("Debug message")  # Only shown if PTOON_DEBUG=1
+
+    Note:
+        Result is cached per name, so the logger is configured once and later
+        calls do not reset a level set through configure_logging().
     """
     logger = logging.getLogger(name)
 
@@ -20,7 +20,7 @@ import math
 from collections.abc import Mapping
 from typing import Any, TypeGuard
 
-from ptoon.logging_config import get_logger
+from ptoon.logging_config import DEBUG_LOG_LEVEL, get_logger
 
 from .types import JsonArray, JsonObject, JsonPrimitive, JsonValue
 
@@ -156,14 +156,16 @@ def normalize_value(value: Any) -> JsonValue:
     if isinstance(value, int):
         # Convert very large integers (beyond JS safe integer range) to string
         if abs(value) > _MAX_SAFE_INTEGER:
-            logger.debug(f"Converting large integer to string: {value} (exceeds 2^53-1)")
+            if logger.isEnabledFor(DEBUG_LOG_LEVEL):
+                logger.debug(f"Converting large integer to string: {value} (exceeds 2^53-1)")
             return str(value)
         return value
 
     if isinstance(value, float):
         # Handle non-finite first
         if not math.isfinite(value) or value != value:  # includes inf, -inf, NaN
-            logger.debug(f"Converting non-finite float to null: {value}")
+            if logger.isEnabledFor(DEBUG_LOG_LEVEL):
+                logger.debug(f"Converting non-finite float to null: {value}")
             return None
         if value == 0.0 and math.copysign(1.0, value) == -1.0:
             logger.debug("Converting negative zero to positive zero")
@@ -173,7 +175,8 @@ def normalize_value(value: Any) -> JsonValue:
     if isinstance(value, datetime.datetime):
         try:
             result = value.isoformat()
-            logger.debug(f"Converting datetime to ISO string: {value}")
+            if logger.isEnabledFor(DEBUG_LOG_LEVEL):
+                logger.debug(f"Converting datetime to ISO string: {value}")
             return result
         except Exception as e:
             raise ValueError(f"Failed to convert datetime to ISO format: {e}") from e
@@ -184,7 +187,8 @@ def normalize_value(value: Any) -> JsonValue:
         return [normalize_value(item) for item in value]
 
     if isinstance(value, set):
-        logger.debug(f"Converting set to sorted list: {len(value)} items")
+        if logger.isEnabledFor(DEBUG_LOG_LEVEL):
+            logger.debug(f"Converting set to sorted list: {len(value)} items")
         try:
             return [normalize_value(item) for item in sorted(value)]
         except TypeError:
@@ -194,7 +198,8 @@ def normalize_value(value: Any) -> JsonValue:
 
     # Handle generic mapping types (Map-like) and dicts
     if isinstance(value, Mapping):
-        logger.debug(f"Converting {type(value).__name__} to dict: {len(value)} items")
+        if logger.isEnabledFor(DEBUG_LOG_LEVEL):
+            logger.debug(f"Converting {type(value).__name__} to dict: {len(value)} items")
         try:
             return {str(k): normalize_value(v) for k, v in value.items()}
         except Exception as e:
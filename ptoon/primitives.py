@@ -20,9 +20,11 @@ Quoting Rules:
     - Look like numbers
 """
 
+import functools
 import re
-from collections.abc import Sequence
+from collections.abc import Callable, Iterable, Sequence
 from decimal import Decimal
+from typing import cast
 
 from ptoon.logging_config import get_logger
 
@@ -55,6 +57,8 @@ _VALID_KEY_PATTERN = re.compile(VALID_KEY_REGEX, re.IGNORECASE)
 
 logger = get_logger(__name__)
 
+_BOOL_LITERALS: dict[JsonPrimitive, str] = {True: TRUE_LITERAL, False: FALSE_LITERAL}
+
 
 def encode_primitive(value: JsonPrimitive, delimiter: Delimiter = COMMA) -> str:
     """Encode a primitive value to TOON string representation.
@@ -264,6 +268,7 @@ def _format_float(value: float) -> str:
     return formatted
 
 
+@functools.lru_cache(maxsize=1024)
 def encode_key(key: str) -> str:
     """Encode an object key, quoting if necessary.
 
@@ -285,6 +290,9 @@ def encode_key(key: str) -> str:
         '"first name"'
         >>> encode_key("123")  # Starts with digit
         '"123"'
+
+    Note:
+        Results are cached, since the same keys repeat across objects.
     """
     if is_valid_unquoted_key(key):
         return key
@@ -341,6 +349,42 @@ def join_encoded_values(values: Sequence[JsonPrimitive], delimiter: Delimiter =
     return delimiter.join(encode_primitive(v, delimiter) for v in values)
 
 
+def select_primitive_encoder(
+    values: Iterable[JsonPrimitive], delimiter: Delimiter = COMMA
+) -> Callable[[JsonPrimitive], str]:
+    """Pick the cheapest encoder that matches encode_primitive for all values.
+
+    Used once per tabular column so that each cell skips the type checks in
+    encode_primitive when the column holds a single exact type.
+
+    Args:
+        values: Primitive values that will be encoded with the result.
+        delimiter: Value delimiter for context-aware string quoting (default: ',').
+
+    Returns:
+        Callable[[JsonPrimitive], str]: Function returning the same text as
+        ``encode_primitive(value, delimiter)`` for each of the values.
+
+    Examples:
+        >>> select_primitive_encoder([1, 2, 3])
+        <class 'str'>
+        >>> select_primitive_encoder([1, "a"])("a")
+        'a'
+    """
+    value_types = {type(v) for v in values}
+    if len(value_types) == 1:
+        value_type = value_types.pop()
+        if value_type is int:
+            return str
+        if value_type is bool:
+            return _BOOL_LITERALS.__getitem__
+        if value_type is float:
+            return cast(Callable[[JsonPrimitive], str], _format_float)
+        if value_type is str:
+            return cast(Callable[[JsonPrimitive], str], functools.partial(encode_string_literal, delimiter=delimiter))
+    return functools.partial(encode_primitive, delimiter=delimiter)
+
+
 def format_header(
     length: int,
     key: str | None = None,
@@ -47,18 +47,21 @@ def _require_tiktoken():
     return tiktoken
 
 
-@functools.lru_cache(maxsize=1)
-def _get_tokenizer():
-    """Get cached tiktoken tokenizer for o200k_base encoding.
+@functools.lru_cache(maxsize=8)
+def _get_tokenizer(encoding: str = "o200k_base"):
+    """Get cached tiktoken tokenizer for the given encoding.
+
+    Args:
+        encoding: Tokenizer encoding name (default: 'o200k_base').
 
     Returns:
-        tiktoken.Encoding: The o200k_base tokenizer (GPT-4o/GPT-4).
+        tiktoken.Encoding: The tokenizer (o200k_base is used by GPT-4o/GPT-4).
 
     Raises:
         RuntimeError: If tiktoken is not installed.
     """
     tiktoken = _require_tiktoken()
-    return tiktoken.get_encoding("o200k_base")
+    return tiktoken.get_encoding(encoding)
 
 
 def count_tokens(text: str, encoding: str = "o200k_base") -> int:
@@ -80,14 +83,24 @@ def count_tokens(text: str, encoding: str = "o200k_base") -> int:
 
     Note:
         Requires tiktoken to be installed: pip install tiktoken
+        Special-token markers such as <|endoftext|> are counted as plain text.
     """
-    if encoding == "o200k_base":
-        enc = _get_tokenizer()
-    else:
-        tiktoken = _require_tiktoken()
-        enc = tiktoken.get_encoding(encoding)
+    enc = _get_tokenizer(encoding)
+    return len(enc.encode_ordinary(text))
+
+
+def _count_tokens_batch(texts: list[str], encoding: str = "o200k_base") -> list[int]:
+    """Count tokens for several strings in a single tiktoken batch call.
+
+    Args:
+        texts: Strings to tokenize.
+        encoding: Tokenizer encoding name (default: 'o200k_base').
 
-    return len(enc.encode(text))
+    Returns:
+        list[int]: Token count for each input string, in order.
+    """
+    enc = _get_tokenizer(encoding)
+    return [len(ids) for ids in enc.encode_ordinary_batch(texts)]
 
 
 def estimate_savings(data: Any, encoding: str = "o200k_base") -> dict[str, Any]:
@@ -115,17 +128,18 @@ def estimate_savings(data: Any, encoding: str = "o200k_base") -> dict[str, Any]:
         Significant savings are typically achieved with structured data,
         especially arrays of uniform objects (tabular data).
     """
-    # Encode as JSON
     json_str = json.dumps(data, indent=2, ensure_ascii=False)
-    json_tokens = count_tokens(json_str, encoding)
-
-    # Encode as TOON
     toon_str = encode(data)
-    toon_tokens = count_tokens(toon_str, encoding)
+    return _savings_from_strings(json_str, toon_str, encoding)
+
+
+def _savings_from_strings(json_str: str, toon_str: str, encoding: str) -> dict[str, Any]:
+    # Tokenize both formats in one batch call
+    json_tokens, toon_tokens = _count_tokens_batch([json_str, toon_str], encoding)
 
     # Calculate savings
     savings = max(0, json_tokens - toon_tokens)
-    savings_percent = (savings / json_tokens * 100.0) if json_tokens > 0 else 0.0
+    savings_percent = savings / (json_tokens or 1) * 100.0
 
     return {
         "json_tokens": json_tokens,
@@ -161,12 +175,10 @@ def compare_formats(data: Any, encoding: str = "o200k_base") -> str:
     Note:
         This is useful for quick visual comparison during development.
     """
-    # Get token metrics
-    metrics = estimate_savings(data, encoding)
-
-    # Encode both formats to get character counts
+    # Encode both formats once and reuse them for token and character counts
     json_str = json.dumps(data, indent=2, ensure_ascii=False)
     toon_str = encode(data)
+    metrics = _savings_from_strings(json_str, toon_str, encoding)
 
     json_chars = len(json_str)
     toon_chars = len(toon_str)
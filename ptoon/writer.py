@@ -1,3 +1,5 @@
+from collections.abc import Iterable
+
 from .types import Depth
 
 
@@ -10,15 +12,22 @@ class LineWriter:
         self._indent_cache: dict[int, str] = {0: ""}
         self._indent_size = indent_size
 
-    def push(self, depth: Depth, content: str):
+    def _indent(self, depth: Depth) -> str:
         if depth not in self._indent_cache:
             if self._indent_size == 0:
                 # indent=0 uses minimal spacing to preserve structure
                 self._indent_cache[depth] = " " * depth
             else:
                 self._indent_cache[depth] = self.indentation_string * depth
-        indent = self._indent_cache[depth]
-        self.lines.append(indent + content)
+        return self._indent_cache[depth]
+
+    def push(self, depth: Depth, content: str):
+        self.lines.append(self._indent(depth) + content)
+
+    def push_many(self, depth: Depth, contents: Iterable[str]):
+        # Same as push() per item, with the indent looked up once for the batch
+        indent = self._indent(depth)
+        self.lines.extend([indent + content for content in contents])
 
     def to_string(self) -> str:
         return "\n".join(self.lines)